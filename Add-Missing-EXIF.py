@@ -1,13 +1,13 @@
 import os
-import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 
 from logger_config import setup_custom_logger
 from tqdm import tqdm
 from shared_methods import (get_exif_data, add_exif_data, setup_database, has_been_processed, record_db_update,
                             close_connection, get_file_count, log_info, log_error, is_first_date_more_recent, 
-                            check_requirements, DATETIME, PHOTO_EXTENSIONS)
+                            check_requirements, DATETIME, PHOTO_EXTENSIONS, STANDARD_FOLDER)
 
 logger = setup_custom_logger('Add-Missing-EXIF')
 script_directory = os.path.dirname(os.path.abspath(__file__))
@@ -19,7 +19,7 @@ DATABASE_COLUMN3 = 'exif_data'
 CONN = None
 
 # Process images in the start_directory    
-def process_images(start_directory):
+def process_images(start_directory, max_workers=8):
     """
     Processes image files within the specified directory, verifying and updating EXIF data.
 
@@ -29,6 +29,7 @@ def process_images(start_directory):
 
     Args:
     - start_directory (str): The directory from which image processing will begin.
+    - max_workers (int, optional): The number of threads used to read EXIF dates with exiftool. Defaults to 8.
 
     Note:
     - Assumes global constants for photo extensions, database connections, logger configurations, and EXIF data patterns.
@@ -38,23 +39,29 @@ def process_images(start_directory):
     total_files = get_file_count(start_directory, PHOTO_EXTENSIONS, logger)
     progress_bar = tqdm(total=total_files, desc='Processing Files', unit='files')
     # Find image files anywhere within the start_directory that match DATETIME format
-    for root, dirs, files in os.walk(start_directory):
-        # Modify dirs in-place to skip non-standard directories
-        dirs[:] = [d for d in dirs if re.match(r'^[a-zA-Z0-9]', d)]
-        files = [f for f in files if '.' + f.split('.')[-1].lower() in PHOTO_EXTENSIONS]
-        for file in files:
-            file_path = os.path.join(root, file)
-            file_name, _ = os.path.splitext(file)        
-            
-            if has_been_processed(CONN, DATABASE_TABLE, DATABASE_PRIMARY, os.path.basename(file_path), logger):
-                progress_bar.update(1)
-                continue
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for root, dirs, files in os.walk(start_directory):
+            # Modify dirs in-place to skip non-standard directories
+            dirs[:] = [d for d in dirs if STANDARD_FOLDER.match(d)]
+            files = [f for f in files if '.' + f.rpartition('.')[2].lower() in PHOTO_EXTENSIONS]
+            file_paths = []
+            for file in files:
+                file_path = os.path.join(root, file)
+
+                if has_been_processed(CONN, DATABASE_TABLE, DATABASE_PRIMARY, os.path.basename(file_path), logger):
+                    progress_bar.update(1)
+                    continue
 
-            # Check if the file has a DATETIME in the filename
-            match = DATETIME.match(file)
-            if match:
-                # Get the date and time from the file's EXIF data
-                exif_date = get_exif_data(file_path, 'DateTimeOriginal', logger, progress_bar)
+                # Only files with a DATETIME in the filename need their EXIF data checked
+                if not DATETIME.match(file):
+                    progress_bar.update(1)
+                    continue
+                file_paths.append(file_path)
+
+            # Each lookup starts its own exiftool process, so read this folder's dates in parallel
+            exif_dates = executor.map(lambda file_path: get_exif_data(file_path, 'DateTimeOriginal', logger, progress_bar), file_paths)
+            for file_path, exif_date in zip(file_paths, exif_dates):
+                file_name, _ = os.path.splitext(os.path.basename(file_path))
                 # if not exif_date or exif_date is more recent than date_time in filename, update exif data with date_time
                 if is_first_date_more_recent(exif_date, file_name):
                     # Add the date and time to the file's EXIF data from filename
@@ -73,7 +80,7 @@ def process_images(start_directory):
                     record_db_update(CONN, DATABASE_TABLE, [DATABASE_PRIMARY, DATABASE_COLUMN2, DATABASE_COLUMN3], 
                                      [os.path.basename(file_path), 'DateTimeOriginal', file_name], logger, [DATABASE_PRIMARY], progress_bar)
                 progress_bar.refresh()
-            progress_bar.update(1)
+                progress_bar.update(1)
     progress_bar.close()    
 
 # Command line interaction
@@ -1,10 +1,10 @@
 import os
-import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from logger_config import setup_custom_logger
 from PIL import Image
-from shared_methods import move_or_rename_file, PHOTO_EXTENSIONS
+from shared_methods import move_or_rename_file, PHOTO_EXTENSIONS, STANDARD_FOLDER
 
 logger = setup_custom_logger('Alert-Custom-Images')
 script_directory = os.path.dirname(os.path.abspath(__file__))
@@ -21,23 +21,30 @@ def is_corrupted(filepath, max_attempts=3):
         except Exception as e:
             print(f"Attempt {attempt+1}: Error checking {filepath}: {str(e)}")
             attempt += 1
-            time.sleep(1)
+            if attempt < max_attempts:
+                time.sleep(1)
     return True
 
-def find_corrupted_images(directory):
-    corrupted_files = []
+def find_corrupted_images(directory, max_workers=8):
+    file_paths = []
     for root, dirs, files in os.walk(directory):
         # Corrected the list comprehension
-        dirs[:] = [d for d in dirs if re.match(r'^[a-zA-Z0-9]', d) and d != corrupted_dir]
-        files = [f for f in files if '.' + f.split('.')[-1].lower() in PHOTO_EXTENSIONS]
+        dirs[:] = [d for d in dirs if STANDARD_FOLDER.match(d) and d != corrupted_dir]
+        files = [f for f in files if '.' + f.rpartition('.')[2].lower() in PHOTO_EXTENSIONS]
         for filename in files:
             _, extension = os.path.splitext(filename)
             if extension.lower() in PHOTO_EXTENSIONS:
-                file_path = os.path.join(root, filename)
-                corrupted_file_path = os.path.join(corrupted_dir, filename)
-                if is_corrupted(file_path):
-                    move_or_rename_file(file_path, corrupted_file_path, logger, None)
-                    corrupted_files.append(corrupted_file_path)
+                file_paths.append(os.path.join(root, filename))
+
+    # Check images on a thread pool, since Pillow releases the GIL while reading and decoding;
+    # files are still moved one at a time, in walk order, so renames cannot collide
+    corrupted_files = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for file_path, corrupted in zip(file_paths, executor.map(is_corrupted, file_paths)):
+            if corrupted:
+                corrupted_file_path = os.path.join(corrupted_dir, os.path.basename(file_path))
+                move_or_rename_file(file_path, corrupted_file_path, logger, None)
+                corrupted_files.append(corrupted_file_path)
     return corrupted_files
 
 if __name__ == "__main__":
@@ -8,12 +8,22 @@ class SynologyDownloadStation:
         self.user_id = user_id
         self.password = password
         self.session_id = None        
-        self.two_weeks_ago = time.time() - 2 * 7 * 24 * 60 * 60  # Two weeks in seconds
+        self.two_weeks_ago = int(time.time()) - 2 * 7 * 24 * 60 * 60  # Two weeks in whole seconds, matching create_time
 
     def log_into_download_station(self):
         print("Logging into Download Station")
-        url = f"http://{self.nas_ip}/webapi/auth.cgi?api=SYNO.API.Auth&version=3&method=login&account={self.user_id}&passwd={self.password}&session=DownloadStation&format=cookie"
-        response = requests.get(url)
+        url = f"http://{self.nas_ip}/webapi/auth.cgi"
+        # Let requests encode the query so an '&', '#' or '+' in the account or password can't break the URL
+        params = {
+            'api': 'SYNO.API.Auth',
+            'version': 3,
+            'method': 'login',
+            'account': self.user_id,
+            'passwd': self.password,
+            'session': 'DownloadStation',
+            'format': 'cookie',
+        }
+        response = requests.get(url, params=params)
         data = response.json()
         if data.get('success'):
             self.session_id = data['data']['sid']
@@ -1,28 +1,31 @@
 import os
 import shutil
-from pathlib import Path
 
-def sync_images(src_dir, dst_dir):
-    src_dir = Path(src_dir)
-    dst_dir = Path(dst_dir)
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.bmp'}
 
-    # Iterate over all files in the source directory
-    for src_path in src_dir.rglob('*'):
-        if src_path.is_file() and src_path.suffix.lower() in ['.jpg', '.jpeg', '.png', '.gif', '.bmp']:
-            # Determine the relative path to the source file
-            rel_path = src_path.relative_to(src_dir)
-            # Determine the destination path
-            dst_path = dst_dir / rel_path
-            
-            # Check if this file already exists at the destination
-            if not dst_path.exists():
-                # Create the directory if it does not exist
-                dst_path.parent.mkdir(parents=True, exist_ok=True)
-                # Copy the file to the destination
-                shutil.copy2(src_path, dst_path)
-                print(f"Copied {src_path} to {dst_path}")
-            else:
-                print(f"File {src_path} already exists at {dst_path}")
+def sync_images(src_dir, dst_dir):
+    # Iterate over all files in the source directory; os.walk already separates files from folders
+    for root, _, files in os.walk(src_dir):
+        # Determine the matching destination folder once for all files in this folder
+        dst_root = os.path.normpath(os.path.join(dst_dir, os.path.relpath(root, src_dir)))
+        dst_root_exists = False
+        for file in files:
+            if os.path.splitext(file)[1].lower() in IMAGE_EXTENSIONS:
+                src_path = os.path.join(root, file)
+                # Determine the destination path
+                dst_path = os.path.join(dst_root, file)
+                
+                # Check if this file already exists at the destination
+                if not os.path.exists(dst_path):
+                    # Create the directory if it does not exist, once per folder
+                    if not dst_root_exists:
+                        os.makedirs(dst_root, exist_ok=True)
+                        dst_root_exists = True
+                    # Copy the file to the destination
+                    shutil.copy2(src_path, dst_path)
+                    print(f"Copied {src_path} to {dst_path}")
+                else:
+                    print(f"File {src_path} already exists at {dst_path}")
 
 if __name__ == "__main__":
     import sys
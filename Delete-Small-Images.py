@@ -3,9 +3,10 @@ import sys
 from PIL import Image
 
 from logger_config import setup_custom_logger
-from shared_methods import log_error, log_info
+from shared_methods import log_debug, log_error, log_info
 
 logger = setup_custom_logger('Delete-Small-Images')
+JPEG_EXTENSIONS = ('.jpeg', '.jpg')
 
 def delete_small_jpeg_files(directory):
     """
@@ -20,32 +21,45 @@ def delete_small_jpeg_files(directory):
     # Define the pixel limit below which files will be deleted
     pixel_limit = 500
 
-    # Walk through the directory tree
-    for root, dirs, files in os.walk(directory):
-        # Modify dirs in-place to skip any directories starting with '@'
-        dirs[:] = [d for d in dirs if not d.startswith('@')]
+    # Walk through the directory tree with os.scandir, so each file's size comes from its directory entry
+    folders = [directory]
+    while folders:
+        try:
+            with os.scandir(folders.pop()) as it:
+                entries = list(it)
+        except OSError as e:
+            log_error(logger, "Error listing folder:", e)
+            continue
 
-        # Iterate over all files in the current directory
-        for filename in files:
-            # Check if the file is a JPEG
-            if filename.lower().endswith(('.jpeg', '.jpg')):
-                # Construct the full path to the file
-                file_path = os.path.join(root, filename)
+        for entry in entries:
+            # Skip any directories starting with '@'
+            if entry.is_dir():
+                if not entry.name.startswith('@') and not entry.is_symlink():
+                    folders.append(entry.path)
+                continue
 
+            filename = entry.name
+            # Check if the file is a JPEG
+            if filename.lower().endswith(JPEG_EXTENSIONS):
                 try:
                     # Get the size of the file
-                    file_size = os.path.getsize(file_path)
+                    file_size = entry.stat().st_size
+
+                    # Files at or above the size limit are kept whatever their dimensions, so skip opening them
+                    if file_size >= size_limit:
+                        log_debug(logger, f"\"{filename}\" checked at {file_size}KB.")
+                        continue
 
                     # Open the image file to check its dimensions
-                    with Image.open(file_path) as img:
+                    with Image.open(entry.path) as img:
                         width, height = img.size
 
                     # If the file size is less than the limit and dimensions are smaller than the pixel limit, delete the file
-                    if file_size < size_limit and (width < pixel_limit or height < pixel_limit):
-                        # os.remove(file_path)
+                    if width < pixel_limit or height < pixel_limit:
+                        # os.remove(entry.path)
                         log_info(logger, f"Deleted \"{filename}\" because it was smaller than 100 KB or dimensions were smaller than 500px.")
                     else:
-                        log_info(logger, f"\"{filename}\" checked at {file_size}KB, width {width}px, height {height}px.")
+                        log_debug(logger, f"\"{filename}\" checked at {file_size}KB, width {width}px, height {height}px.")
                 
                 except Exception as e:
                     log_error(logger, f"Error processing file \"{filename}\": {e}")
@@ -3,6 +3,12 @@ from PIL import Image
 import time  # Import the time module for the sleep function
 import shutil # for moving files
 
+from logger_config import setup_custom_logger
+from shared_methods import log_debug, log_error, log_info, log_warning
+
+logger = setup_custom_logger('Find-Corrupt-Photos')
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.tiff', '.bmp', '.gif')
+
 def is_corrupted(filepath, max_attempts=3):
     attempt = 0
     while attempt < max_attempts:
@@ -15,9 +21,10 @@ def is_corrupted(filepath, max_attempts=3):
                 img.transpose(Image.FLIP_LEFT_RIGHT)  # Simple operation to force image reading
             return False  # If no exception, image is OK
         except Exception as e:
-            print(f"Attempt {attempt+1}: Error checking {filepath}: {str(e)}")
+            log_warning(logger, f"Attempt {attempt+1}: Error checking {filepath}: {str(e)}")
             attempt += 1
-            time.sleep(1)  # Wait a bit before retrying
+            if attempt < max_attempts:
+                time.sleep(1)  # Wait a bit before retrying
     return True  # If all attempts fail, image is corrupted
 
 # Resolve the full path of the current directory
@@ -33,12 +40,11 @@ output_file = directory + "\\corrupted_photos.txt"
 
 # Read existing corrupted file entries to prevent duplicates
 existing_entries = set()
-if os.path.exists(output_file):
+try:
     with open(output_file, 'r') as file:
         existing_entries = {line.strip() for line in file}
-
-# Open the output file in append mode only if needed
-file = open(output_file, 'a') if existing_entries else open(output_file, 'w')
+except FileNotFoundError:
+    pass
 
 # Walk through the directory and subdirectories
 total_files = 0
@@ -51,7 +57,7 @@ with open(output_file, 'a' if existing_entries else 'w') as file:
             dirs.remove(corrupted_dir)  # This prevents os.walk from walking into corrupted directory
 
         for filename in files:
-            if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.tiff', '.bmp', '.gif')):
+            if filename.lower().endswith(IMAGE_EXTENSIONS):
                 total_files += 1
                 file_path = os.path.join(root, filename)
                 corrupted_file_path = os.path.join(corrupted_dir, filename)
@@ -61,24 +67,21 @@ with open(output_file, 'a' if existing_entries else 'w') as file:
                         try:
                             existing_entries.add(file_path)                            
                             shutil.move(file_path, corrupted_file_path)  # Move the corrupted file
-                            print(f"Moved: {file_path} to {corrupted_file_path}")
+                            log_info(logger, f"Moved: {file_path} to {corrupted_file_path}")
                             file.write(f"{corrupted_file_path}\n")
                             file.flush()                            
                         except Exception as e:
-                            print(f"Failed to write to file: {e}")
+                            log_error(logger, "Failed to write to file:", e)
                     else:
-                        print(f"File checked and OK: {file_path}")
+                        log_debug(logger, f"File checked and OK: {file_path}")
                 elif  file_path != corrupted_file_path:
                     shutil.move(file_path, corrupted_file_path)  # Move the corrupted file
-                    print(f"Moved: {file_path} to {corrupted_file_path}")
+                    log_info(logger, f"Moved: {file_path} to {corrupted_file_path}")
                 else:
-                    print(f"File already checked: {file_path}")
-                
-# Close the file
-file.close()
+                    log_debug(logger, f"File already checked: {file_path}")
 
 # Output the total number of image files and corrupted files
-print(f"Total image files checked: {total_files}")
-print(f"Total corrupted files found: {corrupted_files}")
+log_info(logger, f"Total image files checked: {total_files}")
+log_info(logger, f"Total corrupted files found: {corrupted_files}")
 
-print(f"Analysis complete. Corrupted files are listed in {output_file}.")
+log_info(logger, f"Analysis complete. Corrupted files are listed in {output_file}.")
@@ -1,26 +1,54 @@
 import os
 import csv
-from mutagen.easyid3 import EasyID3
-from mutagen.mp3 import MP3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from mutagen.id3 import ID3, ID3NoHeaderError, TXX, TXXX
 from mutagen.flac import FLAC
 from mutagen.oggvorbis import OggVorbis
 from mutagen.mp4 import MP4
 from mutagen.mp4 import MP4FreeForm
 
+from logger_config import setup_custom_logger
+from shared_methods import close_connection, log_debug, log_error, log_info, log_warning, setup_database
+
+logger = setup_custom_logger('Find-Duplicate-Songs')
+script_directory = os.path.dirname(os.path.abspath(__file__))
+DATABASE_NAME = os.path.join(script_directory, 'song_fingerprints.db')
+DATABASE_TABLE = 'fingerprints'
+DATABASE_PRIMARY = 'file_path'
+DATABASE_COLUMN2 = 'modified'
+DATABASE_COLUMN3 = 'fingerprint'
+CONN = None
+tag_errors = []
+
+def read_id3_fingerprint(file_path):
+    # Only user text frames are parsed; cover art and other frames are kept as raw bytes, and the MPEG stream is never scanned.
+    # TXX is the ID3v2.2 name for TXXX (older iTunes rips); mutagen upgrades it to TXXX only if it is a known frame.
+    try:
+        tags = ID3(file_path, known_frames={'TXXX': TXXX, 'TXX': TXX}, load_v1=False)
+    except ID3NoHeaderError:
+        return {}
+    frame = tags.get('TXXX:Acoustid Fingerprint')
+    return {'acoustid_fingerprint': frame.text} if frame else {}
+
+# Format-specific tag readers, keyed on the lower-cased file extension
+TAG_READERS = {
+    '.mp3': read_id3_fingerprint,
+    '.flac': FLAC,
+    '.ogg': OggVorbis,
+    '.m4a': MP4,
+    '.aac': MP4,
+    '.mp4': MP4,
+}
+
 def get_acoustid_fingerprint(file_path):
     try:
-        if file_path.lower().endswith('.mp3'):
-            audio = MP3(file_path, ID3=EasyID3)
-        elif file_path.lower().endswith('.flac'):
-            audio = FLAC(file_path)
-        elif file_path.lower().endswith('.ogg'):
-            audio = OggVorbis(file_path)
-        elif file_path.lower().endswith(('.m4a', '.aac', '.mp4')):
-            audio = MP4(file_path)
-        else:
+        reader = TAG_READERS.get(os.path.splitext(file_path)[1].lower())
+        if reader is None:
             return None
-        
-        print(f"Reading {file_path}...")
+        audio = reader(file_path)
+
+        log_debug(logger, f"Reading {file_path}...")
         fingerprint = audio.get("acoustid_fingerprint", [None])[0]
         if not fingerprint:
             mp4fingerprint = audio.get("----:com.apple.iTunes:Acoustid Fingerprint", [None])[0]
@@ -28,46 +56,125 @@ def get_acoustid_fingerprint(file_path):
                 fingerprint = mp4fingerprint.decode("utf-8")
 
         if not fingerprint:
-            print(f"Could not find fingerprint for {file_path}")
+            log_warning(logger, f"Could not find fingerprint for {file_path}")
             return None
 
         return fingerprint
     except Exception as e:
-        print(f"Error reading {file_path}: {e}")
-        with open(error_csv, mode='a', newline='', encoding='utf-8') as csv_file:
-            writer = csv.writer(csv_file)
-            writer.writerow([file_path, str(e)])
+        log_error(logger, f"Error reading {file_path}:", e)
+        # Collected here and written in one go by save_tag_errors_to_csv; list.append is safe across worker threads
+        tag_errors.append([file_path, str(e)])
+        return None
+
+def get_modified_time(file_path):
+    try:
+        return os.stat(file_path).st_mtime_ns
+    except OSError:
         return None
 
-def find_duplicates(music_folder):
+def load_cached_fingerprints():
+    # Map each song read on a previous run to the modified time and fingerprint recorded for it
+    c = CONN.cursor()
+    try:
+        c.execute(f"SELECT {DATABASE_PRIMARY}, {DATABASE_COLUMN2}, {DATABASE_COLUMN3} FROM {DATABASE_TABLE}")
+        return {file_path: (modified, fingerprint) for file_path, modified, fingerprint in c.fetchall()}
+    finally:
+        c.close()
+
+def record_fingerprints(rows):
+    # Write every newly read fingerprint in one transaction, rather than committing once per song
+    if not rows:
+        return
+    c = CONN.cursor()
+    try:
+        c.executemany(f'''
+            INSERT INTO {DATABASE_TABLE} ({DATABASE_PRIMARY}, {DATABASE_COLUMN2}, {DATABASE_COLUMN3}) 
+            VALUES (?, ?, ?) 
+            ON CONFLICT({DATABASE_PRIMARY}) 
+            DO UPDATE SET {DATABASE_COLUMN2} = excluded.{DATABASE_COLUMN2}, {DATABASE_COLUMN3} = excluded.{DATABASE_COLUMN3}
+        ''', rows)
+        CONN.commit()
+    except Exception as e:
+        log_error(logger, "Error recording fingerprints in database:", e)
+        sys.exit(1)
+    finally:
+        c.close()
+
+def find_duplicates(music_folder, max_workers=8):
     fingerprints = {}
     duplicates = []
 
+    # Skip artwork, playlists and other non-audio files before they reach a worker
+    songs = []
     for root, _, files in os.walk(music_folder):
         for file in files:
-            file_path = os.path.join(root, file)
-            fingerprint = get_acoustid_fingerprint(file_path)
+            if os.path.splitext(file)[1].lower() in TAG_READERS:
+                file_path = os.path.join(root, file)
+                songs.append((file_path, get_modified_time(file_path)))
+
+    # Only read tags from songs that are new or have changed since their fingerprint was recorded.
+    # Songs that could not be stat'ed are always read, so any error is logged rather than matched against the cache.
+    cached = load_cached_fingerprints()
+    file_paths = [file_path for file_path, modified in songs
+                  if modified is None or cached.get(file_path, (None, None))[0] != modified]
+    log_info(logger, f"Reading tags from {len(file_paths)} of {len(songs)} songs.")
+
+    # Tag reads are I/O bound, so read several files at once
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        read_fingerprints = dict(zip(file_paths, executor.map(get_acoustid_fingerprint, file_paths)))
+
+    new_rows = []
+    for file_path, modified in songs:
+        if file_path in read_fingerprints:
+            fingerprint = read_fingerprints[file_path]
             if fingerprint:
-                if fingerprint in fingerprints:
-                    duplicates.append((file_path, fingerprints[fingerprint]))
-                else:
-                    fingerprints[fingerprint] = file_path
+                new_rows.append((file_path, modified, fingerprint))
+        else:
+            fingerprint = cached.get(file_path, (None, None))[1]
+
+        if fingerprint:
+            if fingerprint in fingerprints:
+                duplicates.append((file_path, fingerprints[fingerprint]))
+            else:
+                fingerprints[fingerprint] = file_path
 
+    record_fingerprints(new_rows)
     return duplicates
 
 def save_duplicates_to_csv(duplicates, output_path):
-    with open(output_path, mode='w', newline='', encoding='utf-8') as csv_file:
+    # Write to a temporary file and swap it in, so a failed run never leaves a truncated report behind
+    temp_path = output_path + '.tmp'
+    with open(temp_path, mode='w', newline='', encoding='utf-8') as csv_file:
         writer = csv.writer(csv_file)
         writer.writerow(["Duplicate File", "Original File"])
-        for duplicate, original in duplicates:
-            writer.writerow([duplicate, original])
+        writer.writerows(duplicates)
+    os.replace(temp_path, output_path)
+
+def save_tag_errors_to_csv(output_path):
+    if not tag_errors:
+        return
+    with open(output_path, mode='a', newline='', encoding='utf-8') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerows(tag_errors)
 
 if __name__ == "__main__":
     music_folder = "D:\\Music"
     output_csv = os.path.join(os.path.dirname(__file__), "duplicate_songs.csv")
     error_csv = os.path.join(os.path.dirname(__file__), "tag_errors.csv")
 
-    duplicates = find_duplicates(music_folder)
-    save_duplicates_to_csv(duplicates, output_csv)
+    CONN = setup_database(DATABASE_NAME, 
+        f'''
+            CREATE TABLE IF NOT EXISTS {DATABASE_TABLE} (
+                {DATABASE_PRIMARY} TEXT PRIMARY KEY,
+                {DATABASE_COLUMN2} INTEGER,
+                {DATABASE_COLUMN3} TEXT
+            )
+        ''', logger)
+    try:
+        duplicates = find_duplicates(music_folder)
+        save_duplicates_to_csv(duplicates, output_csv)
+    finally:
+        save_tag_errors_to_csv(error_csv)
+        close_connection(CONN, logger)
 
-    print(f"Duplicate list saved to {output_csv}")
+    log_info(logger, f"Duplicate list saved to {output_csv}")
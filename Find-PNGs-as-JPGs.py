@@ -1,11 +1,11 @@
 import os
-import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from logger_config import setup_custom_logger
 from tqdm import tqdm
 from shared_methods import (get_exif_data, setup_database, has_been_processed, move_or_rename_file, close_connection, 
-                            record_db_update, get_file_count, log_info, log_error, PHOTO_EXTENSIONS)
+                            record_db_update, get_file_count, log_info, log_error, PHOTO_EXTENSIONS, STANDARD_FOLDER)
 
 logger = setup_custom_logger('Find-PNGs-as-JPGs')
 script_directory = os.path.dirname(os.path.abspath(__file__))
@@ -15,10 +15,11 @@ DATABASE_PRIMARY = 'file_name'
 DATABASE_COLUMN2 = 'extension'
 DATABASE_COLUMN3 = 'file_type'
 DATABASE_COLUMN4 = 'new_file_name'
+JPEG_EXTENSIONS = {'.jpg', '.jpeg'}
 CONN = None
 
 # Process images in the start_directory
-def process_images(start_directory):
+def process_images(start_directory, max_workers=8):
     """
     Processes image files within the specified directory, updating filenames based on EXIF data.
 
@@ -28,6 +29,7 @@ def process_images(start_directory):
 
     Args:
     - start_directory (str): The directory from which the image processing will begin.
+    - max_workers (int, optional): The number of threads used to read file types with exiftool. Defaults to 8.
 
     Note:
     - Assumes the existence of global constants for photo extensions, database connections, and logger configurations.
@@ -37,47 +39,51 @@ def process_images(start_directory):
     total_files = get_file_count(start_directory, PHOTO_EXTENSIONS, logger)
     progress_bar = tqdm(total=total_files, desc='Processing Files', unit='files')
     # Find image files anywhere within the start_directory that match DATETIME format
-    for root, dirs, files in os.walk(start_directory):
-        # Modify dirs in-place to skip non-standard directories
-        dirs[:] = [d for d in dirs if re.match(r'^[a-zA-Z0-9]', d)]
-        files = [f for f in files if '.' + f.split('.')[-1].lower() in PHOTO_EXTENSIONS]
-        for file in files:
-            file_path = os.path.join(root, file)
-            if has_been_processed(CONN, DATABASE_TABLE, [DATABASE_PRIMARY, DATABASE_COLUMN4], os.path.basename(file_path), logger):
-                progress_bar.update(1)
-                continue
-            
-            _, file_extension = os.path.splitext(file)
-            file_type = None
-            file_type = get_exif_data(file_path, 'FileType', logger, progress_bar)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for root, dirs, files in os.walk(start_directory):
+            # Modify dirs in-place to skip non-standard directories
+            dirs[:] = [d for d in dirs if STANDARD_FOLDER.match(d)]
+            files = [f for f in files if '.' + f.rpartition('.')[2].lower() in PHOTO_EXTENSIONS]
+            file_paths = []
+            for file in files:
+                file_path = os.path.join(root, file)
+                if has_been_processed(CONN, DATABASE_TABLE, [DATABASE_PRIMARY, DATABASE_COLUMN4], os.path.basename(file_path), logger):
+                    progress_bar.update(1)
+                    continue
+                file_paths.append(file_path)
+
+            # Each lookup starts its own exiftool process, so read this folder's file types in parallel
+            file_types = executor.map(lambda file_path: get_exif_data(file_path, 'FileType', logger, progress_bar), file_paths)
+            for file_path, file_type in zip(file_paths, file_types):
+                _, file_extension = os.path.splitext(file_path)
             
-            # if file_extension doesn't match file_type, rename the file
-            if ((file_extension.lower() in ['.jpg', '.jpeg'] and file_type.lower() == 'png') or 
-                (file_extension.lower() == '.png' and file_type.lower() == 'jpeg')):
-                new_file_path = file_path.replace(file_extension, f".{file_type.lower()}")
-                new_file_path = move_or_rename_file(file_path, new_file_path, logger, progress_bar)
-                if new_file_path:
+                # if file_extension doesn't match file_type, rename the file
+                if ((file_extension.lower() in JPEG_EXTENSIONS and file_type.lower() == 'png') or 
+                    (file_extension.lower() == '.png' and file_type.lower() == 'jpeg')):
+                    new_file_path = file_path.replace(file_extension, f".{file_type.lower()}")
+                    new_file_path = move_or_rename_file(file_path, new_file_path, logger, progress_bar)
+                    if new_file_path:
+                        record_db_update(
+                            CONN, 
+                            DATABASE_TABLE, 
+                            [DATABASE_PRIMARY, DATABASE_COLUMN2, DATABASE_COLUMN3, DATABASE_COLUMN4], 
+                            [os.path.basename(file_path), file_extension, file_type, os.path.basename(new_file_path)], 
+                            logger, 
+                            [DATABASE_PRIMARY],
+                            progress_bar)
+
+                else:
+                    log_info(logger, f"\"{file_path}\" is correctly labeled as a \"{file_type}\" file.", progress_bar)
                     record_db_update(
                         CONN, 
                         DATABASE_TABLE, 
                         [DATABASE_PRIMARY, DATABASE_COLUMN2, DATABASE_COLUMN3, DATABASE_COLUMN4], 
-                        [os.path.basename(file_path), file_extension, file_type, os.path.basename(new_file_path)], 
-                        logger, 
+                        [os.path.basename(file_path), file_extension, file_type, os.path.basename(file_path)], 
+                        logger,
                         [DATABASE_PRIMARY],
                         progress_bar)
-
-            else:
-                log_info(logger, f"\"{file_path}\" is correctly labeled as a \"{file_type}\" file.", progress_bar)
-                record_db_update(
-                    CONN, 
-                    DATABASE_TABLE, 
-                    [DATABASE_PRIMARY, DATABASE_COLUMN2, DATABASE_COLUMN3, DATABASE_COLUMN4], 
-                    [os.path.basename(file_path), file_extension, file_type, os.path.basename(file_path)], 
-                    logger,
-                    [DATABASE_PRIMARY],
-                    progress_bar)
-            progress_bar.refresh()
-            progress_bar.update(1)
+                progress_bar.refresh()
+                progress_bar.update(1)
     progress_bar.close()
     
 
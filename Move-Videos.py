@@ -2,7 +2,6 @@ import os
 import sys
 import shutil
 import datetime
-from pathlib import Path
 from logger_config import setup_custom_logger
 from shared_methods import log_error, log_info
 
@@ -13,21 +12,20 @@ def find_and_move_videos(source_path, destination_root):
 
     for root, _, files in os.walk(source_path, followlinks=True):
         for file in files:
-            file_path = Path(root) / file
-
-            if file_path.suffix.lower() in video_extensions:
+            if os.path.splitext(file)[1].lower() in video_extensions:
+                file_path = os.path.join(root, file)
                 try:
-                    creation_time = datetime.datetime.fromtimestamp(file_path.stat().st_ctime)
+                    creation_time = datetime.datetime.fromtimestamp(os.stat(file_path).st_ctime)
                     year_folder = creation_time.strftime('%Y')
                 except Exception as e:
                     log_error(logger, f"Error retrieving creation date for {file_path}", e)
                     year_folder = 'Unknown'
 
-                destination_path = Path(destination_root) / year_folder
-                destination_path.mkdir(parents=True, exist_ok=True)
+                destination_path = os.path.join(destination_root, year_folder)
+                os.makedirs(destination_path, exist_ok=True)
 
                 try:
-                    shutil.move(str(file_path), str(destination_path / file))
+                    shutil.move(file_path, os.path.join(destination_path, file))
                     log_info(logger, f'Moved: {file_path} to {destination_path}')
                 except Exception as e:
                     log_error(logger, f"Error moving {file_path}", e)
@@ -85,9 +85,6 @@ def process_files(start_directory):
                 file_path, new_file_path = create_new_filename_from_exif_data(dirpath, file_path, extension, photo, video, progress_bar)
                 
             if file_path and new_file_path:
-                if not os.path.exists(os.path.dirname(new_file_path)):
-                    os.makedirs(os.path.dirname(new_file_path))
-                
                 new_file_path = move_or_rename_file(file_path, new_file_path, logger, progress_bar)
                 if new_file_path and not has_been_processed(CONN, DATABASE_TABLE, [DATABASE_PRIMARY, DATABASE_COLUMN2], [os.path.basename(new_file_path), os.path.basename(file_path)], logger):
                     record_db_update(
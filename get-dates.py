@@ -1,22 +1,29 @@
 import datetime
+import functools
 import re
 
+DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')  # Regex to match YYYY-MM-DD format
+
+# Many photos share a day, so each distinct date string is only parsed and formatted once
+@functools.lru_cache(maxsize=4096)
+def format_date(date_part):
+    # DATE_PATTERN guarantees YYYY-MM-DD, so slice the fields directly rather than going through strptime
+    date_obj = datetime.date(int(date_part[:4]), int(date_part[5:7]), int(date_part[8:10]))
+    # Format date as 'd MMM yyyy'
+    return date_obj.strftime('%d %b %Y').lstrip('0')
+
 def extract_unique_days(file_path):
     unique_dates = set()  # Use a set to store unique dates
-    date_pattern = re.compile(r'\d{4}-\d{2}-\d{2}')  # Regex to match YYYY-MM-DD format
 
     with open(file_path, 'r') as file:
         for line in file:
             file_name = line.strip().split('\\')[-1]  # Get the file name
             # Search for date pattern in the file name
-            match = date_pattern.search(file_name)
+            match = DATE_PATTERN.search(file_name)
             if match:
                 date_part = match.group(0)  # Extract the date string
                 try:
-                    date_obj = datetime.datetime.strptime(date_part, '%Y-%m-%d')
-                    # Format date as 'd MMM yyyy'
-                    formatted_date = date_obj.strftime('%d %b %Y').lstrip('0')
-                    unique_dates.add(formatted_date)
+                    unique_dates.add(format_date(date_part))
                 except ValueError as e:
                     print(f"Skipping file due to error parsing date: {file_name}, Error: {str(e)}")
             else:
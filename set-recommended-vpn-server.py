@@ -10,6 +10,7 @@ from datetime import datetime
 # Set up logging
 from logger_config import setup_custom_logger
 logger = setup_custom_logger('Set-Recommended-VPN-Server')
+CONF_NAME = re.compile(r"^.*conf_name=(.*)$")
 
 # Function to fetch the recommended servers
 def get_recommended_servers():
@@ -43,7 +44,7 @@ def get_configured_vpns():
 
     vpns = []
     for line in config_split:
-        match_name = re.match(r"^.*conf_name=(.*)$", line)
+        match_name = CONF_NAME.match(line)
         if match_name:
             vpn_name = match_name.group(1)
             vpns.append(vpn_name)
@@ -88,9 +89,10 @@ def main():
 
         # Find the highest recommended server that is configured
         for server in normalized_recommended_servers:            
+            server_pattern = re.compile(server, re.IGNORECASE)
             for vpn_name in configured_vpns:
                 # Check if the server is configured
-                if re.search(server, vpn_name, re.IGNORECASE):
+                if server_pattern.search(vpn_name):
                     logger.info(f"Connecting to recommended server: {server}")
                     connect_to_vpn(vpn_name)
                     logger.info(f"Successfully connected to {server}")
@@ -144,9 +146,12 @@ def track_server_usage(recommended_servers):
     # Sort the server_usage dictionary by count in descending order and then by last recommended date in descending order
     sorted_server_usage = {k: v for k, v in sorted(server_usage.items(), key=lambda item: (item[1]['count'], item[1]['last recommended']), reverse=True)}
 
-    # Save the updated and sorted server usage data back to the file
-    with open(file_path, 'w') as file:
+    # Save the updated and sorted server usage data back to the file, via a temporary file so an
+    # interrupted run cannot leave a truncated file behind for the next run to fail on
+    temp_file_path = file_path + '.tmp'
+    with open(temp_file_path, 'w') as file:
         json.dump(sorted_server_usage, file, indent=4)
+    os.replace(temp_file_path, file_path)
 
 
 if __name__ == "__main__":
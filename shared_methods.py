@@ -1,19 +1,34 @@
+import errno
 import glob
 import os
+import queue
 import re
 import shutil
 import sqlite3
+import stat
 import subprocess
 import sys
+import threading
+import time
 import importlib.util
+from collections import deque
 from datetime import datetime
 from importlib import metadata
 
 DATETIME = re.compile(r'^\d{4}[\-\:\.]\d{2}[\-\:\.]\d{2}\s\d{2}[\-\:\.]\d{2}[\-\:\.]\d{2}([\-\:\.]\d{3})?', re.IGNORECASE)
 DESIRED_FORMAT = re.compile(r'^(\d{4}-\d{2}-\d{2} \d{2}\.\d{2}\.\d{2}\.\d{3})', re.IGNORECASE)
+STANDARD_FOLDER = re.compile(r'^[a-zA-Z0-9]')
 PHOTO_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif' }
 VIDEO_EXTENSIONS = {'.m4v', '.mov', '.mp4', '.mkv', '.wmv', '.webm'}
 MEDIA_EXTENSIONS = PHOTO_EXTENSIONS.union(VIDEO_EXTENSIONS)
+_WRITE_MASK = stat.S_IWUSR | stat.S_IWRITE
+_DIR_MASK = _WRITE_MASK | stat.S_IXUSR
+# Errors worth retrying when a folder is briefly held open by antivirus, indexing or the NAS
+_RETRY_ERRNOS = {errno.EBUSY, errno.EACCES, errno.ENOTEMPTY}
+# System and metadata folders (Synology '@eaDir', '.git', '$RECYCLE.BIN', '~tmp') that don't stop a folder counting as empty
+_IGNORED_FOLDER_PREFIXES = ('@', '.', '$', '~')
+# Destination folders already known to exist, so repeated moves into the same folder skip the stat
+_known_folders = set()
 
 # Helper function to add EXIF data to the file
 def add_exif_data(file_path, exif_tag, exif_data, logger, progress_bar=None):
@@ -168,9 +183,9 @@ def delete_empty_folders(directory, logger, progress_bar=None):
     """
     Recursively deletes all empty folders in a specified directory.
 
-    This function traverses the specified directory from bottom to top, identifying and deleting
-    any subdirectories that are empty. Each deletion attempt is logged. Errors encountered during
-    deletion are also logged.
+    This function traverses the specified directory from bottom to top, identifying
+    any subdirectories that are empty, and then deletes them from the deepest up.
+    Each deletion attempt is logged. Errors encountered during deletion are also logged.
 
     Args:
     - directory (str): The path of the directory to check for empty subdirectories.
@@ -179,22 +194,28 @@ def delete_empty_folders(directory, logger, progress_bar=None):
 
     Note:
     - The function uses os.walk with topdown=False to ensure that it checks subdirectories before their parents.
-    - Deletion is attempted only on directories that are completely empty (no files or subdirectories).
+    - A directory is empty when it has no files and all of its subdirectories are empty.
+    - Each folder is checked again just before it is removed, so a folder that gained files during the walk
+      fails to delete rather than losing them.
     """
+    empty_folders = set()
+    # Collected in walk order, so children always come before their parents
+    removal_order = []
     for dirpath, dirnames, filenames in os.walk(directory, topdown=False):
-        dirnames[:] = [d for d in dirnames 
-                       if not d.startswith('@') 
-                       and not d.startswith('.') 
-                       and not d.startswith('$') 
-                       and not d.startswith('~')]
+        dirnames[:] = [d for d in dirnames if not d.startswith(_IGNORED_FOLDER_PREFIXES)]
         
         # Check if directory is empty
-        if not dirnames and not filenames:
-            try:
-                shutil.rmtree(dirpath, ignore_errors=True)
-                log_info(logger, f"Deleted empty folder: {dirpath}", progress_bar)
-            except OSError as e:
-                log_error(logger, f"Failed to delete {dirpath}:", e, progress_bar)
+        if not filenames and all(os.path.join(dirpath, d) in empty_folders for d in dirnames):
+            empty_folders.add(dirpath)
+            removal_order.append(dirpath)
+
+    for dirpath in removal_order:
+        try:
+            remove_empty_folder(dirpath)
+            _known_folders.discard(dirpath)
+            log_info(logger, f"Deleted empty folder: {dirpath}", progress_bar)
+        except OSError as e:
+            log_error(logger, f"Failed to delete {dirpath}:", e, progress_bar)
 
 def get_date_object(date_str):
     """
@@ -224,6 +245,12 @@ def get_date_object(date_str):
     date_part = date_str.split(' ')[0]
     # Sanitize the date part to ensure it uses '-' as the separator
     sanitized_date_part = date_part.replace(':', '-').replace('.', '-')    
+    # Fast path for the usual zero-padded 'YYYY-MM-DD', which fromisoformat parses far quicker than strptime
+    if len(sanitized_date_part) == 10 and sanitized_date_part[4] == '-' and sanitized_date_part[7] == '-':
+        try:
+            return datetime.fromisoformat(sanitized_date_part)
+        except ValueError:
+            pass
     # Parse the date part
     return datetime.strptime(sanitized_date_part, date_format)
 
@@ -354,7 +381,7 @@ def get_exif_datetime(file_path, date_exif_tag, micro_exif_tag, logger, progress
     return datetime_str        
 
 # Get the count of files in a directory based on the filter
-def get_file_count(directory, filter, logger, progress_bar=None):
+def get_file_count(directory, filter, logger, progress_bar=None, max_workers=8):
     """
     Counts the number of files in a directory that match a given filter.
 
@@ -367,20 +394,64 @@ def get_file_count(directory, filter, logger, progress_bar=None):
     - filter (list): A list of string extensions to include in the count.
     - logger: A logging object used for logging information and errors.
     - progress_bar (optional): An optional progress bar object for visual progress feedback.
+    - max_workers (int, optional): The number of threads scanning folders concurrently. Defaults to 8.
 
     Returns:
     - int: The total number of files matching the filter in the specified directory.
 
     Raises:
     - Exception: Captures and logs any exceptions that occur during the file counting process.
+
+    Note:
+    - Each folder is scanned as a separate task on a pool of worker threads, so several directory listings
+      are in flight at once. This hides the per-folder latency of network shares.
+    - Folders that cannot be listed are skipped, matching the behaviour of os.walk.
     """
     try:
         log_info(logger, f"Counting {filter} files in directory: {directory}", progress_bar)
-        total_files = 0
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if re.match(r'^[a-zA-Z0-9]', d)]
-            files = [f for f in files if '.' + f.split('.')[-1].lower() in filter]
-            total_files += len(files)
+        pending = queue.Queue()
+        counts = deque()
+        errors = deque()
+
+        def count_folder():
+            while True:
+                folder = pending.get()
+                try:
+                    if folder is None:
+                        return
+                    files = 0
+                    with os.scandir(folder) as entries:
+                        for entry in entries:
+                            if entry.is_dir():
+                                # Only descend into standard, non-linked directories
+                                if not entry.is_symlink() and STANDARD_FOLDER.match(entry.name):
+                                    pending.put(entry.path)
+                            elif '.' + entry.name.rpartition('.')[2].lower() in filter:
+                                files += 1
+                    counts.append(files)
+                except OSError:
+                    pass
+                except Exception as e:
+                    # Keep the worker alive so queued folders are still marked done; the error is raised after join()
+                    errors.append(e)
+                finally:
+                    pending.task_done()
+
+        pending.put(directory)
+        workers = [threading.Thread(target=count_folder, daemon=True) for _ in range(max_workers)]
+        for worker in workers:
+            worker.start()
+
+        # Wait for every queued folder to be scanned, then release the workers
+        pending.join()
+        for _ in workers:
+            pending.put(None)
+        for worker in workers:
+            worker.join()
+
+        if errors:
+            raise errors[0]
+        total_files = sum(counts)
     except Exception as e:
         log_error(logger, f"Error counting files in directory: {e}", progress_bar)
         total_files = 0
@@ -509,8 +580,9 @@ def move_or_rename_file(source, destination, logger, progress_bar=None):
         
         # Check if the destination folder exists, if not, create it
         destination_folder = os.path.dirname(destination)
-        if not os.path.exists(destination_folder):
-            os.makedirs(destination_folder)
+        if destination_folder not in _known_folders:
+            os.makedirs(destination_folder, exist_ok=True)
+            _known_folders.add(destination_folder)
 
         os.rename(source, destination)
         # Log moved if file name is same, but destination folder is different
@@ -620,6 +692,89 @@ def log_warning(logger, message, progress_bar=None):
 
 import sys
 
+def _remove_readonly(func, path, exc):
+    """
+    Clears the read-only flag on a path that shutil.rmtree failed to delete, then retries the deletion.
+
+    Args:
+    - func: The function that raised the exception (os.unlink or os.rmdir).
+    - path (str): The path that could not be deleted.
+    - exc (Exception): The exception raised by func.
+
+    Raises:
+    - Exception: Re-raises exc if the failure was not a permission error on a file or folder removal,
+      or propagates any error from the retry.
+
+    Note:
+    - The path is inspected with a single os.lstat call. Symbolic links are retried without a chmod,
+      since chmod would change the permissions of the link's target instead.
+    - The write bits are added to the existing mode rather than replacing it, so a path is never left unreadable.
+    """
+    if func not in (os.remove, os.unlink, os.rmdir) or not isinstance(exc, PermissionError):
+        raise exc
+    mode = os.lstat(path).st_mode
+    if stat.S_ISREG(mode):
+        os.chmod(path, stat.S_IMODE(mode) | _WRITE_MASK)
+    elif stat.S_ISDIR(mode) and func is os.rmdir:
+        os.chmod(path, stat.S_IMODE(mode) | _DIR_MASK)
+    elif not stat.S_ISLNK(mode):
+        raise exc
+    func(path)
+
+def remove_empty_folder(folder_path):
+    """
+    Deletes a folder only if it is still empty, apart from ignored system and metadata folders.
+
+    Args:
+    - folder_path (str): The path of the folder to delete.
+
+    Raises:
+    - OSError: If the folder contains files, links or other folders, or cannot be deleted.
+
+    Note:
+    - Ignored folders (starting with '@', '.', '$' or '~') are deleted with remove_folder, then the folder
+      itself is removed with os.rmdir, which refuses to delete anything that appeared in the meantime.
+    """
+    with os.scandir(folder_path) as entries:
+        entries = list(entries)
+    for entry in entries:
+        if not entry.is_dir(follow_symlinks=False) or not entry.name.startswith(_IGNORED_FOLDER_PREFIXES):
+            raise OSError(errno.ENOTEMPTY, "Folder is not empty", folder_path)
+    for entry in entries:
+        remove_folder(entry.path)
+    try:
+        os.rmdir(folder_path)
+    except PermissionError as e:
+        _remove_readonly(os.rmdir, folder_path, e)
+
+def remove_folder(folder_path, max_attempts=4):
+    """
+    Deletes a folder and everything in it, clearing read-only flags that would otherwise block the deletion.
+
+    Args:
+    - folder_path (str): The path of the folder to delete.
+    - max_attempts (int, optional): How many times to try the deletion before giving up. Defaults to 4.
+
+    Raises:
+    - OSError: If the folder or any of its contents cannot be deleted.
+
+    Note:
+    - Uses the onexc callback on Python 3.12+, and falls back to onerror on older versions.
+    - Busy, access-denied and not-empty errors are retried after 0.05, 0.1 and 0.2 seconds, as they are
+      usually caused by another process briefly holding a handle in the folder.
+    """
+    for attempt in range(max_attempts):
+        try:
+            if sys.version_info >= (3, 12):
+                shutil.rmtree(folder_path, onexc=_remove_readonly)
+            else:
+                shutil.rmtree(folder_path, onerror=lambda func, path, excinfo: _remove_readonly(func, path, excinfo[1]))
+            return
+        except OSError as e:
+            if attempt == max_attempts - 1 or e.errno not in _RETRY_ERRNOS:
+                raise
+            time.sleep(0.05 * (1 << attempt))
+
 def record_db_update(conn, table_name: str, columns: list, values: list, logger, unique_columns: list, progress_bar=None):
     """
     Records an update to a specified table in the database by inserting a new row